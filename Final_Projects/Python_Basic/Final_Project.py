@@ -1,8 +1,7 @@
-import argparse
 import os
-import json
-import shutil
-import datetime
+import sys
+# argparse, json and shutil are imported by the functions that need them, so
+# short commands like pwd start without loading them
 
 
 WHITE = '\033[97m'
@@ -23,6 +22,7 @@ def setup():
     Returns:
         argparse.ArgumentParser: The configured argument parser.
     """
+    import argparse
     parser = argparse.ArgumentParser(
         description="File manipulation and directory navigation CLI tool"
     )
@@ -84,8 +84,9 @@ def log_command(command, status, error_message=None):
         status (str): The status of the command execution (e.g., 'Success', 'Error').
         error_message (str, optional): Additional error information if the command failed.
     """
+    import time
     with open(LOG_FILE, 'a') as log:
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
         log_entry = f"{timestamp} - Command: {command}, Status: {status}"
         if error_message:
             log_entry += f", Error: {error_message}"
@@ -101,6 +102,7 @@ def load_working_directory():
         str: The working directory path.
     """
     if os.path.exists(WORKING_DIR_FILE):
+        import json
         with open(WORKING_DIR_FILE, 'r') as file:
             data = json.load(file)
             return data.get('cwd', os.getcwd())
@@ -115,6 +117,7 @@ def save_working_directory(path):
     Args:
         path (str): The path to be saved as the working directory.
     """
+    import json
     with open(WORKING_DIR_FILE, 'w') as file:
         json.dump({'cwd': path}, file)
 
@@ -216,6 +219,7 @@ def remove_directory(path):
     full_path = os.path.join(cwd, path)
 
     is_valid_path(full_path)
+    import shutil
     shutil.rmtree(full_path)
     print(f"Directory '{full_path}' and its contents removed recursively.")
 
@@ -243,6 +247,7 @@ def copy_file(source, destination):
     is_valid_path(source_path)
     is_valid_path(destination_path)
 
+    import shutil
     if os.path.isdir(source_path):
         shutil.copytree(source_path, destination_path)
         print(f"Directory '{source_path}' copied to '{destination_path}'.")
@@ -290,6 +295,7 @@ def move_file(source, destination):
     is_valid_path(source_path) 
     is_valid_path(destination_path)
 
+    import shutil
     shutil.move(source_path, destination_path)
     print(f"Moved '{source_path}' to '{destination_path}'.")
     
@@ -388,59 +394,85 @@ def print_working_dir():
     print(cwd)
 
 
-def main():
-    """
-    The main function of the CLI tool.
+class Args:
+    """Parsed command line, filled by parse_fast() or argparse."""
+    path = '.'
+    destination = None
+    pattern = None
+    recursive = None
+    file = None
+    all = False
 
-    Parses command-line arguments and invokes corresponding functions
-    based on the specified command. It handles various file and directory
-    operations like listing, creating, removing, copying, and moving files or directories.
-    """
-    parser = setup()
-    args = parser.parse_args()
-
-    try:
-        if args.command == 'ls':
-            list_directory(args.path, show_hidden=args.all)
 
-        elif args.command == 'mkdir':
-            create_directory(args.path)
-
-        elif args.command == "pwd":
-            print_working_dir()
+def parse_fast(argv):
+    """
+    Parse command lines that only have positional arguments, without argparse.
 
-        elif args.command == 'cd':
-            change_directory(args.path)
+    Most calls look like "pwd", "ls some/dir" or "mv a b". Anything with an
+    option, or with too many arguments, is left to argparse so that errors
+    and help messages stay the same.
 
-        elif args.command == 'rmdir':
-            remove_empty_directory(args.path)
+    Args:
+        argv (list): The command line arguments without the script name.
 
-        elif args.command == 'rm':
-            if args.recursive:
-                remove_directory(args.recursive)
-            else:
-                remove_file(args.path)
+    Returns:
+        Args: The parsed arguments, or None if argparse has to parse them.
+    """
+    if not 1 <= len(argv) <= 3 or any(arg.startswith('-') for arg in argv):
+        return None
+    args = Args()
+    args.command = argv[0]
+    if len(argv) > 1:
+        args.path = argv[1]
+    if len(argv) > 2:
+        args.destination = argv[2]
+    return args
+
+
+def remove(args):
+    """Remove a directory recursively with -r, otherwise remove a file."""
+    if args.recursive:
+        remove_directory(args.recursive)
+    else:
+        remove_file(args.path)
 
-        elif args.command == 'cp':
-            copy_file(args.path, args.destination)
 
-        elif args.command == 'mv':
-            move_file(args.path, args.destination)
+# command name ==> function that runs it with the parsed arguments
+COMMANDS = {
+    'ls': lambda args: list_directory(args.path, show_hidden=args.all),
+    'mkdir': lambda args: create_directory(args.path),
+    'pwd': lambda args: print_working_dir(),
+    'cd': lambda args: change_directory(args.path),
+    'rmdir': lambda args: remove_empty_directory(args.path),
+    'rm': remove,
+    'cp': lambda args: copy_file(args.path, args.destination),
+    'mv': lambda args: move_file(args.path, args.destination),
+    'find': lambda args: find_files(args.path, args.pattern),
+    'logs': lambda args: view_logs(),
+    'cat': lambda args: cat_file(args.file),
+}
 
-        elif args.command == 'find':
-            find_files(args.path, args.pattern)
 
-        elif args.command == "logs":
-            view_logs()
+def main():
+    """
+    The main function of the CLI tool.
 
-        elif args.command == "cat":
-            cat_file(args.file)
+    Parses command-line arguments and invokes corresponding functions
+    based on the specified command. It handles various file and directory
+    operations like listing, creating, removing, copying, and moving files or directories.
+    """
+    args = parse_fast(sys.argv[1:])
+    if args is None:
+        args = setup().parse_args()
 
-        else:
-            print("Invalid Command!")
-            log_command(args.command, "Error", "Invalid command")
-            return
+    command = COMMANDS.get(args.command)
+    if command is None:
+        print("Invalid Command!")
+        log_command(args.command, "Error", "Invalid command")
+        return
 
+    try:
+        command(args)
         log_command(args.command, "Success")
 
     except Exception as e:
@@ -448,4 +480,4 @@ def main():
         log_command(args.command, "Error", str(e))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,7 +1,15 @@
-product_names = []
-product_is_bought = []
-product_prices = []
-for i in range(100):
+# This session keeps its products in memory only, they are saved between runs
+# by the catalog of Session07 (catalog_store.py)
+# products in the order they were added, {"name": ..., "bought": ..., "price": ...}
+# a removed product leaves None in its slot, so no other product moves
+records = []
+# name ==> slot in records, a dict finds a product without scanning
+products = {}
+removed = 0
+# running totals for details
+purchased = 0
+total_price = 0
+while True:
   answer = input("help, add, display, edit, remove, search, buy, details, exit: ")
   if answer == "help":
     help_text = """
@@ -18,40 +26,49 @@ for i in range(100):
     print(help_text)
   elif answer == "add":
     name = input("product name: ")
-    if name not in product_names:
-      product_names.append(name)
-      product_is_bought.append(False)
-      product_prices.append(None)
+    if name not in products:
+      products[name] = len(records)
+      records.append({"name": name, "bought": False, "price": None})
       print("added!")
     else:
       print(f"{name}:already exists!")
   elif answer == "display":
-    if len(product_names) == 0:
+    if len(products) == 0:
       print("Empty!")
-    for i, p in enumerate(product_names):
-      bought = product_is_bought[i]
-      price = product_prices[i]
-      print(f"{i+1}){p} ==> bought: {bought}, price: {price}")
+    for i, product in enumerate(product for product in records if product is not None):
+      print(f"{i+1}){product['name']} ==> bought: {product['bought']}, price: {product['price']}")
   elif answer == "remove":
     name = input("product name: ")
-    if name in product_names:
-      ind = product_names.index(name)
-      product_names.pop(ind)
-      product_is_bought.pop(ind)
-      product_prices.pop(ind)
+    if name in products:
+      slot = products.pop(name)
+      product = records[slot]
+      records[slot] = None
+      removed += 1
+      if product["bought"]:
+        purchased -= 1
+        total_price -= product["price"]
+      # drop the empty slots once they are half of the list (amortized O(1))
+      if removed * 2 > len(records):
+        records = [product for product in records if product is not None]
+        products = {product["name"]: slot for slot, product in enumerate(records)}
+        removed = 0
       print("removed!")
     else:
       print(f"{name}: not found!")
   elif answer == "edit":
     old_name = input("product name: ") # p1
-    if old_name in product_names:
+    if old_name in products:
       new_name = input("new name: ") # p5
-      if new_name not in product_names: # True
-        ind = product_names.index(old_name) # 0
-        product_names[ind] = new_name # 0 ====> p5
+      if new_name not in products: # True
+        # the product keeps its slot, so its place in display (p1 ====> p5)
+        slot = products.pop(old_name)
+        products[new_name] = slot
+        product = records[slot]
+        product["name"] = new_name
         new_price = int(input("new price: ")) # 100
-        if product_prices[ind] != None:
-          product_prices[ind] = new_price # 0 ===> 100
+        if product["price"] != None:
+          total_price += new_price - product["price"]
+          product["price"] = new_price # 0 ===> 100
         else:
           print("Not purchased!")
         print("edited!")
@@ -61,33 +78,31 @@ for i in range(100):
       print(f"{old_name}: not found!")
   elif answer == "search":
     name = input("product name: ")
-    if name in product_names:
-      ind = product_names.index(name)
-      bought = product_is_bought[ind]
-      price = product_prices[ind]
-      print(f"{name} ==> bought: {bought}, price: {price}")
+    if name in products:
+      product = records[products[name]]
+      print(f"{name} ==> bought: {product['bought']}, price: {product['price']}")
     else:
       print(f"{name} : not found!")
   elif answer == "details":
-    total = len(product_names)
-    not_purchased = product_is_bought.count(False)
-    purchased = product_is_bought.count(True)
+    total = len(products)
+    not_purchased = total - purchased
     print(f"total: {total}")
     print(f"purchased: {purchased}")
     print(f"not purchased: {not_purchased}")
-    prices = []
-    for i in product_prices:
-      if i:
-        prices.append(i)
-    print(f"sum: {sum(prices)}")
+    print(f"sum: {total_price}")
   elif answer == "buy":
     name = input("product name: ")
-    if name in product_names:
+    if name in products:
       price = int(input(f"price of {name}: "))
       # edit
-      ind = product_names.index(name)
-      product_prices[ind] = price
-      product_is_bought[ind] = True
+      product = records[products[name]]
+      if product["bought"]:
+        total_price -= product["price"]
+      else:
+        purchased += 1
+      product["price"] = price
+      product["bought"] = True
+      total_price += price
       print("bought!")
     else:
       print(f"{name}: not found!")
@@ -1,3 +1,9 @@
+import csv
+import sys
+
+from catalog_store import PersistentCatalog
+from product_batch import run_batch
+
 # .................functions...................
 def help():
   help_text = """
@@ -8,48 +14,37 @@ def help():
     - search: Searches for a product.
     - display: Displays all products.
     - buy: Buys a product.
+    - details: Displays totals of the products.
+    - batch: Runs the operations of a CSV file.
     - help: Displays this help text.
     - exit: Exits the program.
     """
   print(help_text)
 
 def add(name):
-  if name not in product_names:
-    product_names.append(name)
-    product_is_bought.append(False)
-    product_prices.append(None)
+  if catalog.add(name):
     print("added!")
   else:
     print(f"{name}:already exists!")
 
 def display():
-  if len(product_names) == 0:
+  if len(catalog) == 0:
     print("Empty!")
-  for i, p in enumerate(product_names):
-    bought = product_is_bought[i]
-    price = product_prices[i]
-    print(f"{i+1}){p} ==> bought: {bought}, price: {price}")
+  for i, product in enumerate(catalog):
+    print(f"{i+1}){product.name} ==> bought: {product.is_bought}, price: {product.price}")
 
 def remove(name) :
-  if name in product_names:
-    ind = product_names.index(name)
-    product_names.pop(ind)
-    product_is_bought.pop(ind)
-    product_prices.pop(ind)
+  if catalog.remove(name):
     print("removed!")
   else:
     print(f"{name}: not found!")
 
 def edit(old_name):
-  if old_name in product_names:
+  if old_name in catalog:
     new_name = input("new name: ") # p5
-    if new_name not in product_names: # True
-      ind = product_names.index(old_name) # 0
-      product_names[ind] = new_name # 0 ====> p5
+    if catalog.rename(old_name, new_name): # True
       new_price = int(input("new price: ")) # 100
-      if product_prices[ind] != None:
-        product_prices[ind] = new_price # 0 ===> 100
-      else:
+      if not catalog.set_price(new_name, new_price):
         print("Not purchased!")
       print("edited!")
     else:
@@ -58,44 +53,63 @@ def edit(old_name):
       print(f"{old_name}: not found!")
 
 def search(name):
-  if name in product_names:
-    ind = product_names.index(name)
-    bought = product_is_bought[ind]
-    price = product_prices[ind]
-    print(f"{name} ==> bought: {bought}, price: {price}")
+  product = catalog.get(name)
+  if product is not None:
+    print(f"{name} ==> bought: {product.is_bought}, price: {product.price}")
   else:
     print(f"{name} : not found!")
+    similar = catalog.find(name)
+    if similar:
+      print(f"similar: {', '.join(similar)}")
 
 def details():
-  total = len(product_names)
-  not_purchased = product_is_bought.count(False)
-  purchased = product_is_bought.count(True)
+  total = len(catalog)
+  purchased = catalog.purchased
+  not_purchased = total - purchased
   print(f"total: {total}")
   print(f"purchased: {purchased}")
   print(f"not purchased: {not_purchased}")
-  prices = []
-  for i in product_prices:
-    if i:
-      prices.append(i)
-  print(f"sum: {sum(prices)}")
+  print(f"sum: {catalog.total_price}")
+  if purchased:
+    print(f"min price: {catalog.prices.min()}")
+    print(f"max price: {catalog.prices.max()}")
+    print(f"mean price: {catalog.prices.mean():.2f}")
 
 def buy(name):
-  if name in product_names:
+  if name in catalog:
     price = int(input(f"price of {name}: "))
-    # edit
-    ind = product_names.index(name)
-    product_prices[ind] = price
-    product_is_bought[ind] = True
+    catalog.buy(name, price)
     print("bought!")
   else:
     print(f"{name}: not found!")
 
+def batch(path):
+  try:
+    summary, examples = run_batch(catalog, path)
+  except OSError as error:
+    print(f"{path}: {error.strerror}!")
+    return
+  except (csv.Error, UnicodeDecodeError) as error:
+    print(f"{path}: invalid CSV file ({error})!")
+    return
+  finally:
+    catalog.checkpoint()
+  print(", ".join(f"{key}: {value}" for key, value in summary.items()))
+  for example in examples:
+    print(f"  {example}")
+  if summary["failed"] > len(examples):
+    print(f"  ... and {summary['failed'] - len(examples)} more")
+
 # ....................main..........................
-product_names = []
-product_is_bought = []
-product_prices = []
-for i in range(100):
-  answer = input("help, add, display, edit, remove, search, buy, details, exit: ")
+catalog = PersistentCatalog("products.db")
+# python Session07_Products_Project(Function).py operations.csv
+if len(sys.argv) > 1:
+  batch(sys.argv[1])
+  details()
+  catalog.close()
+  sys.exit()
+while True:
+  answer = input("help, add, display, edit, remove, search, buy, details, batch, exit: ")
   if answer == "help":
     help()
   elif answer == "add":
@@ -117,9 +131,13 @@ for i in range(100):
   elif answer == "buy":
     name = input("product name: ")
     buy(name)
+  elif answer == "batch":
+    path = input("file of operations: ")
+    batch(path)
   elif answer == "":
     continue
   elif answer == "exit":
+    catalog.close()
     break
   else:
     print(f"{answer}: command not found!")
\ No newline at end of file
@@ -0,0 +1,209 @@
+# Catalog saved on disk: a SQLite snapshot of all products plus a log of the
+# operations done since the last snapshot (write-ahead log).
+# Opening only reads one row of totals, products are read when they are asked
+# for, so a catalog with millions of products is ready right away.
+import json
+import os
+import sqlite3
+
+from product_catalog import Product
+from product_search import SearchIndex
+
+# Operations kept in the log before they are saved into the snapshot
+CHECKPOINT_EVERY = 1000
+
+
+# Same methods as PriceStats: count and sum are kept in memory, min and max
+# come from the price index of the snapshot
+class StoredPriceStats:
+  def __init__(self, db, count, total):
+    self.db = db
+    self.count = count
+    self.total = total
+
+  def add(self, price):
+    self.count += 1
+    self.total += price
+
+  def discard(self, price):
+    self.count -= 1
+    self.total -= price
+
+  def min(self):
+    return self.db.execute("SELECT MIN(price) FROM products").fetchone()[0]
+
+  def max(self):
+    return self.db.execute("SELECT MAX(price) FROM products").fetchone()[0]
+
+  def mean(self):
+    return self.total / self.count if self.count else None
+
+
+class PersistentCatalog:
+  def __init__(self, path):
+    self.path = path
+    self.log_path = path + ".log"
+    self.db = sqlite3.connect(path)
+    # let SQLite read the snapshot through a memory map instead of read() calls
+    self.db.execute("PRAGMA mmap_size = 1073741824")
+    self.db.execute("""CREATE TABLE IF NOT EXISTS products (
+      slot INTEGER PRIMARY KEY AUTOINCREMENT,
+      name TEXT UNIQUE NOT NULL,
+      is_bought INTEGER NOT NULL DEFAULT 0,
+      price INTEGER)""")
+    self.db.execute("CREATE INDEX IF NOT EXISTS products_price ON products (price)")
+    # left by older versions that searched in SQLite, they are not updated anymore
+    self.db.execute("DROP INDEX IF EXISTS products_name")
+    self.db.execute("DROP TABLE IF EXISTS product_grams")
+    self.db.execute("""CREATE TABLE IF NOT EXISTS totals (
+      id INTEGER PRIMARY KEY CHECK (id = 1),
+      products INTEGER NOT NULL,
+      purchased INTEGER NOT NULL,
+      total_price INTEGER NOT NULL,
+      applied INTEGER NOT NULL)""")
+    self.db.execute("INSERT OR IGNORE INTO totals VALUES (1, 0, 0, 0, 0)")
+    self.db.commit()
+    self.size, purchased, total_price, self.applied = self.db.execute(
+      "SELECT products, purchased, total_price, applied FROM totals").fetchone()
+    self.prices = StoredPriceStats(self.db, purchased, total_price)
+    self.pending = 0
+    # built by the first find() and then kept up to date, like in Catalog
+    self.names_index = None
+    self.replay()
+    self.log = open(self.log_path, "a")
+
+  @property
+  def purchased(self):
+    return self.prices.count
+
+  @property
+  def total_price(self):
+    return self.prices.total
+
+  def __len__(self):
+    return self.size
+
+  def __contains__(self, name):
+    return self.db.execute("SELECT 1 FROM products WHERE name = ?", (name,)).fetchone() is not None
+
+  def __iter__(self):
+    for name, is_bought, price in self.db.execute(
+        "SELECT name, is_bought, price FROM products ORDER BY slot"):
+      yield self.make_product(name, is_bought, price)
+
+  def make_product(self, name, is_bought, price):
+    product = Product(name)
+    product.is_bought = bool(is_bought)
+    product.price = price
+    return product
+
+  def get(self, name):
+    row = self.db.execute(
+      "SELECT name, is_bought, price FROM products WHERE name = ?", (name,)).fetchone()
+    if row is None:
+      return None
+    return self.make_product(*row)
+
+  # names starting with or similar to text, best first
+  def find(self, text, limit=10):
+    if self.names_index is None:
+      self.names_index = SearchIndex(name for (name,) in self.db.execute("SELECT name FROM products"))
+    return self.names_index.search(text, limit)
+
+  # ..........operations, each one is written to the log..........
+  def add(self, name):
+    return self.run(["add", name])
+
+  def remove(self, name):
+    return self.run(["remove", name])
+
+  def rename(self, old_name, new_name):
+    return self.run(["rename", old_name, new_name])
+
+  def buy(self, name, price):
+    return self.run(["buy", name, price])
+
+  def set_price(self, name, price):
+    return self.run(["set_price", name, price])
+
+  def run(self, operation):
+    done = self.apply(operation)
+    if done:
+      self.applied += 1
+      self.log.write(json.dumps([self.applied] + operation) + "\n")
+      self.log.flush()
+      self.pending += 1
+      if self.pending >= CHECKPOINT_EVERY:
+        self.checkpoint()
+    return done
+
+  def apply(self, operation):
+    kind, name = operation[0], operation[1]
+    product = self.get(name)
+    if kind == "add":
+      if product is not None:
+        return False
+      self.db.execute("INSERT INTO products (name) VALUES (?)", (name,))
+      if self.names_index is not None:
+        self.names_index.add(name)
+      self.size += 1
+      return True
+    if product is None:
+      return False
+    if kind == "remove":
+      self.db.execute("DELETE FROM products WHERE name = ?", (name,))
+      if self.names_index is not None:
+        self.names_index.remove(name)
+      if product.is_bought:
+        self.prices.discard(product.price)
+      self.size -= 1
+    elif kind == "rename":
+      new_name = operation[2]
+      if new_name in self:
+        return False
+      self.db.execute("UPDATE products SET name = ? WHERE name = ?", (new_name, name))
+      if self.names_index is not None:
+        self.names_index.rename(name, new_name)
+    elif kind == "buy" or kind == "set_price":
+      price = operation[2]
+      if product.is_bought:
+        self.prices.discard(product.price)
+      elif kind == "set_price":
+        return False
+      self.db.execute("UPDATE products SET is_bought = 1, price = ? WHERE name = ?", (price, name))
+      self.prices.add(price)
+    return True
+
+  # ..........snapshot and log..........
+  def save_totals(self):
+    self.db.execute(
+      "UPDATE totals SET products = ?, purchased = ?, total_price = ?, applied = ?",
+      (self.size, self.prices.count, self.prices.total, self.applied))
+    self.db.commit()
+
+  # save everything into the snapshot and start an empty log
+  def checkpoint(self):
+    self.save_totals()
+    self.log.truncate(0)
+    self.pending = 0
+
+  # apply the operations that were logged but never saved into the snapshot
+  def replay(self):
+    if not os.path.exists(self.log_path):
+      return
+    with open(self.log_path, "r") as file:
+      for line in file:
+        try:
+          entry = json.loads(line)
+        except ValueError:
+          break # last line was cut by a crash
+        if entry[0] > self.applied:
+          self.apply(entry[1:])
+          self.applied = entry[0]
+    self.save_totals()
+    open(self.log_path, "w").close()
+
+  def close(self):
+    self.checkpoint()
+    self.log.close()
+    self.db.close()
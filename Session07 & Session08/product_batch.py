@@ -0,0 +1,48 @@
+# Run many product operations from a CSV file in one go, one operation per line:
+#   add,<name>
+#   buy,<name>,<price>
+#   edit,<old name>,<new name>[,<new price>]
+#   remove,<name>
+import csv
+
+# Failed lines described in the summary, the others are only counted
+EXAMPLES = 3
+
+
+# returns the number of operations done per command plus "failed", and the
+# first EXAMPLES failed lines
+def run_batch(catalog, path):
+  summary = {"add": 0, "buy": 0, "edit": 0, "remove": 0, "failed": 0}
+  examples = []
+  with open(path, "r", newline="") as file:
+    for line_number, row in enumerate(csv.reader(file), 1):
+      if not row or row[0].startswith("#"):
+        continue
+      command = row[0].strip()
+      problem = "not done"
+      try:
+        if command == "add":
+          done = catalog.add(row[1])
+        elif command == "buy":
+          done = catalog.buy(row[1], int(row[2]))
+        elif command == "edit":
+          # the price is checked first, a bad line must not rename anything
+          price = int(row[3]) if len(row) > 3 and row[3] != "" else None
+          done = catalog.rename(row[1], row[2])
+          if done and price is not None:
+            catalog.set_price(row[2], price)
+        elif command == "remove":
+          done = catalog.remove(row[1])
+        else:
+          problem = "command not found"
+          done = False
+      except (IndexError, ValueError):
+        problem = "invalid line"
+        done = False
+      if done:
+        summary[command] += 1
+      else:
+        summary["failed"] += 1
+        if len(examples) < EXAMPLES:
+          examples.append(f"line {line_number}: {','.join(row)}: {problem}")
+  return summary, examples
@@ -0,0 +1,164 @@
+# Catalog of products: a dict from name to slot (hash index) and a list of
+# records (record store), so add, remove, edit, search and buy are all O(1)
+import heapq
+
+from product_search import SearchIndex
+
+# One product, __slots__ keeps every record small
+class Product:
+  __slots__ = ("name", "is_bought", "price")
+
+  def __init__(self, name):
+    self.name = name
+    self.is_bought = False
+    self.price = None
+
+
+# Count, sum, min, max and mean of the prices of bought products, updated on
+# every change. Removed prices stay in the heaps until they reach the top, or
+# until they outnumber the live ones and the heaps are rebuilt.
+class PriceStats:
+  def __init__(self):
+    self.count = 0
+    self.total = 0
+    self.live = {} # price ==> how many bought products have it
+    self.low = [] # min-heap of prices
+    self.high = [] # min-heap of negative prices
+
+  def add(self, price):
+    self.count += 1
+    self.total += price
+    if self.live.get(price, 0) == 0:
+      heapq.heappush(self.low, price)
+      heapq.heappush(self.high, -price)
+    self.live[price] = self.live.get(price, 0) + 1
+
+  def discard(self, price):
+    self.count -= 1
+    self.total -= price
+    self.live[price] -= 1
+    if self.live[price] == 0:
+      del self.live[price]
+      # every rebuild follows as many removals as it costs (amortized O(1))
+      if len(self.low) > 2 * len(self.live):
+        self.low = list(self.live)
+        heapq.heapify(self.low)
+        self.high = [-price for price in self.live]
+        heapq.heapify(self.high)
+
+  def min(self):
+    while self.low and self.low[0] not in self.live:
+      heapq.heappop(self.low)
+    return self.low[0] if self.low else None
+
+  def max(self):
+    while self.high and -self.high[0] not in self.live:
+      heapq.heappop(self.high)
+    return -self.high[0] if self.high else None
+
+  def mean(self):
+    return self.total / self.count if self.count else None
+
+
+class Catalog:
+  def __init__(self):
+    self.records = [] # removed products leave None in their slot
+    self.index = {} # name ==> slot in records
+    self.removed = 0
+    # running totals for details()
+    self.prices = PriceStats()
+    # built by the first find() and then kept up to date
+    self.names_index = None
+
+  @property
+  def purchased(self):
+    return self.prices.count
+
+  @property
+  def total_price(self):
+    return self.prices.total
+
+  def __len__(self):
+    return len(self.index)
+
+  def __contains__(self, name):
+    return name in self.index
+
+  # live products in the order they were added
+  def __iter__(self):
+    for product in self.records:
+      if product is not None:
+        yield product
+
+  def get(self, name):
+    slot = self.index.get(name)
+    if slot is None:
+      return None
+    return self.records[slot]
+
+  def add(self, name):
+    if name in self.index:
+      return False
+    self.index[name] = len(self.records)
+    self.records.append(Product(name))
+    if self.names_index is not None:
+      self.names_index.add(name)
+    return True
+
+  def remove(self, name):
+    slot = self.index.pop(name, None)
+    if slot is None:
+      return False
+    product = self.records[slot]
+    if product.is_bought:
+      self.prices.discard(product.price)
+    self.records[slot] = None
+    self.removed += 1
+    if self.names_index is not None:
+      self.names_index.remove(name)
+    # drop the empty slots once they are half of the list (amortized O(1))
+    if self.removed * 2 > len(self.records):
+      self.compact()
+    return True
+
+  def rename(self, old_name, new_name):
+    if old_name not in self.index or new_name in self.index:
+      return False
+    slot = self.index.pop(old_name)
+    self.index[new_name] = slot
+    self.records[slot].name = new_name
+    if self.names_index is not None:
+      self.names_index.rename(old_name, new_name)
+    return True
+
+  def buy(self, name, price):
+    product = self.get(name)
+    if product is None:
+      return False
+    if product.is_bought:
+      self.prices.discard(product.price)
+    product.is_bought = True
+    product.price = price
+    self.prices.add(price)
+    return True
+
+  # change the price of a product that is already bought
+  def set_price(self, name, price):
+    product = self.get(name)
+    if product is None or not product.is_bought:
+      return False
+    self.prices.discard(product.price)
+    product.price = price
+    self.prices.add(price)
+    return True
+
+  # names starting with or similar to text, best first
+  def find(self, text, limit=10):
+    if self.names_index is None:
+      self.names_index = SearchIndex(product.name for product in self)
+    return self.names_index.search(text, limit)
+
+  def compact(self):
+    self.records = [product for product in self.records if product is not None]
+    self.index = {product.name: slot for slot, product in enumerate(self.records)}
+    self.removed = 0
@@ -0,0 +1,169 @@
+# Search over product names: a trie for names that start with the text and a
+# trigram index (pieces of 3 letters) for names that are only similar to it,
+# so typos like "lapotp" still find "laptop". Both are updated one name at a
+# time by the catalog, nothing is rebuilt after add, edit or remove.
+# Names one typo away are also looked up in the trie directly: a typo in the
+# rare part of a name (e.g. its number) leaves only common trigrams to match.
+import heapq
+from itertools import islice
+
+# Candidates are collected from the rarest trigrams of the query first, and
+# the common ones are skipped once this many names were looked at (the final
+# score still counts every trigram)
+CANDIDATE_BUDGET = 1000
+# Names scored exactly for a fuzzy query
+CANDIDATES = 20
+
+
+def trigrams(text):
+  text = f"  {text.lower()} "
+  return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# the names with the most trigrams in common with the query (Dice similarity)
+def rank(query, names, limit):
+  scores = []
+  for name in names:
+    grams = trigrams(name)
+    scores.append((2 * len(query & grams) / (len(query) + len(grams)), name))
+  scores.sort(key=lambda item: (-item[0], item[1]))
+  return [name for score, name in scores[:limit]]
+
+
+class SearchIndex:
+  def __init__(self, names=()):
+    self.trie = {} # letter ==> child node, None ==> names ending here
+    self.grams = {} # trigram ==> names that contain it
+    for name in names:
+      self.add(name)
+
+  def add(self, name):
+    node = self.trie
+    for letter in name.lower():
+      node = node.setdefault(letter, {})
+    node.setdefault(None, set()).add(name)
+    for gram in trigrams(name):
+      self.grams.setdefault(gram, set()).add(name)
+
+  def remove(self, name):
+    path = [self.trie]
+    for letter in name.lower():
+      node = path[-1].get(letter)
+      if node is None:
+        return
+      path.append(node)
+    path[-1].get(None, set()).discard(name)
+    # drop the nodes that no name uses anymore
+    if not path[-1].get(None):
+      path[-1].pop(None, None)
+    for i in range(len(path) - 1, 0, -1):
+      if path[i]:
+        break
+      del path[i - 1][name.lower()[i - 1]]
+    for gram in trigrams(name):
+      names = self.grams.get(gram)
+      if names is not None:
+        names.discard(name)
+        if not names:
+          del self.grams[gram]
+
+  def rename(self, old_name, new_name):
+    self.remove(old_name)
+    self.add(new_name)
+
+  # names that start with prefix in alphabetical order
+  def complete(self, prefix, limit=10):
+    node = self.trie
+    for letter in prefix.lower():
+      node = node.get(letter)
+      if node is None:
+        return []
+    result = []
+    stack = [node]
+    while stack and len(result) < limit:
+      node = stack.pop()
+      result.extend(sorted(node.get(None, ())))
+      stack.extend(node[letter] for letter in sorted((k for k in node if k is not None), reverse=True))
+    return result[:limit]
+
+  # names one typo away from text (a letter left out, added or changed, or two
+  # neighbouring letters swapped), the trie is walked once for all of them
+  def near(self, text):
+    text = text.lower()
+    found = set()
+    # node, letters of text already matched, typo already used
+    stack = [(self.trie, 0, False)]
+    while stack:
+      node, i, used = stack.pop()
+      if i == len(text):
+        found.update(node.get(None, ()))
+      else:
+        child = node.get(text[i])
+        if child is not None:
+          stack.append((child, i + 1, used))
+      if used:
+        continue
+      for letter, child in node.items():
+        if letter is None:
+          continue
+        stack.append((child, i, True)) # a letter missing in text
+        if i < len(text) and letter != text[i]:
+          stack.append((child, i + 1, True)) # a letter changed
+      if i < len(text):
+        stack.append((node, i + 1, True)) # a letter too many in text
+      if i + 1 < len(text) and text[i] != text[i + 1]:
+        child = node.get(text[i + 1])
+        child = child and child.get(text[i])
+        if child:
+          stack.append((child, i + 2, True)) # two letters swapped
+    return found
+
+  # names one typo away first, then the names that share the most trigrams
+  # with text, best first
+  def fuzzy(self, text, limit=10):
+    query = trigrams(text)
+    close = self.near(text)
+    # levels[i] holds the names found in i + 1 of the trigram lists taken so far
+    levels = []
+    visited = 0
+    for names in sorted((self.grams[gram] for gram in query if gram in self.grams), key=len):
+      # two lists at least, or every name of a common word would tie
+      if len(levels) >= 2 and visited + len(names) > CANDIDATE_BUDGET:
+        break
+      visited += len(names)
+      levels.append(set())
+      for level in range(len(levels) - 2, -1, -1):
+        found = levels[level] & names
+        levels[level] -= found
+        levels[level + 1] |= found
+      if len(levels) == 1:
+        levels[0].update(islice(names, CANDIDATE_BUDGET))
+      elif len(names) <= CANDIDATE_BUDGET:
+        levels[0] |= names.difference(*levels[1:])
+    candidates = []
+    for level in reversed(levels):
+      if len(candidates) + len(level) > CANDIDATES:
+        # a typo keeps the length, so names of about the same length go first
+        level = heapq.nsmallest(CANDIDATES - len(candidates), level,
+                                key=lambda name: abs(len(name) - len(text)))
+      candidates.extend(level)
+      if len(candidates) >= CANDIDATES:
+        break
+    result = rank(query, close, limit)
+    for name in rank(query, candidates, limit):
+      if len(result) >= limit:
+        break
+      if name not in close:
+        result.append(name)
+    return result
+
+  # prefix matches first, then similar names
+  def search(self, text, limit=10):
+    result = self.complete(text, limit)
+    if len(result) < limit:
+      for name in self.fuzzy(text, limit):
+        if len(result) >= limit:
+          break
+        if name not in result:
+          result.append(name)
+    return result
@@ -1,12 +1,21 @@
 # Importing necessary liberaries
+import csv
 import datetime
+import json
+import math
 
 # Dictionary to save booking information
 bookings = {}
 # Constant for total number of cars
 total_cars = 10
+# Price of one day of booking, used when a booking has no price of its own
+price_per_day = 100
 # Variable to generate unique booking codes
 code = 1
+# Number of rows saved together by bulk import
+chunk_size = 10000
+# Parsed dates, reused because historical data repeats the same days a lot
+date_cache = {}
 
 # ----------------Functions----------------
 # Function to display help information
@@ -17,6 +26,9 @@ def help():
     search: Search Booking
     cancel: Cancel Booking
     details: show details of the project
+    report: show occupancy, utilisation and revenue of the whole history
+    import: Import Bookings from a CSV or JSON-lines file
+    export: Export all Bookings to a CSV or JSON-lines file
     exit: exit\n"""
   print (help_text)
 
@@ -36,17 +48,49 @@ def validate_date(input_date):
     return False, "Invalid date"
   return True, "Valid date"
 
+# Function to validate and convert a batch of dates without strptime
+# returns a list of dates, with None in place of every invalid one
+def parse_dates(input_dates):
+  result = []
+  for input_date in input_dates:
+    # rows from files can hold anything: missing values, numbers, lists...
+    if not isinstance(input_date, str):
+      result.append(None)
+      continue
+    date = date_cache.get(input_date)
+    if date is None:
+      try:
+        if len(input_date) != 10 or input_date[4] != "-" or input_date[7] != "-":
+          raise ValueError
+        # the same checks as validate_date, int() alone accepts " 1", "+1" or "1_0"
+        if not (input_date[:4].isdigit() and input_date[5:7].isdigit() and input_date[8:].isdigit()):
+          raise ValueError
+        # date() itself rejects days like 2023-02-30
+        date = datetime.date(int(input_date[:4]), int(input_date[5:7]), int(input_date[8:]))
+      except ValueError:
+        result.append(None)
+        continue
+      date_cache[input_date] = date
+    result.append(date)
+  return result
+
 def find_days(start_date, end_date):
   if start_date == end_date:
     return 0
   else:
     new_start_date = start_date + datetime.timedelta(days=1)
     return 1 + find_days(new_start_date, end_date)
+# Function to count the bookings that still hold a car (ending today or later),
+# imported history that is already over does not take any car
+def count_booked_cars():
+  today = datetime.date.today()
+  return sum(1 for booking in bookings.values() if booking["end_date"] >= today)
+
 # Function to handle booking of cars
 def booking():
   global code # Declare code as global since we're modifying it
   # Check if all cars are already booked
-  if len(bookings) >= total_cars:
+  if count_booked_cars() >= total_cars:
     print("all cars are booked!")
     return
   name = input("enter you name: ")
@@ -102,6 +146,101 @@ def display():
   else:
     print("empty")
 
+# Function to read rows of a CSV or JSON-lines file one by one
+def read_rows(path):
+  with open(path, "r", newline="") as file:
+    if path.endswith(".jsonl"):
+      for line in file:
+        if line.strip():
+          # a line that is not JSON is given as None, import_chunk skips it
+          try:
+            yield json.loads(line)
+          except ValueError:
+            yield None
+    else:
+      yield from csv.DictReader(file)
+
+# Function to validate one chunk of rows and save the valid ones
+def import_chunk(rows):
+  global code
+  # JSON lines can hold anything, only objects are bookings
+  skipped = sum(1 for row in rows if not isinstance(row, dict))
+  rows = [row for row in rows if isinstance(row, dict)]
+  starts = parse_dates([row.get("start_date", "") for row in rows])
+  ends = parse_dates([row.get("end_date", "") for row in rows])
+  new_bookings = {}
+  for row, start_date, end_date in zip(rows, starts, ends):
+    if start_date is None or end_date is None or start_date > end_date:
+      skipped += 1
+      continue
+    price = row.get("price")
+    if price not in (None, ""):
+      try:
+        price = float(price)
+      except (TypeError, ValueError):
+        skipped += 1
+        continue
+      # float() also takes "nan" and "inf", which would spoil the revenue
+      if not math.isfinite(price):
+        skipped += 1
+        continue
+    new_bookings[code] = {
+      "name" : row.get("name", ""),
+      "start_date" : start_date,
+      "end_date" : end_date,
+      "days" : (end_date - start_date).days
+    }
+    if row.get("car"):
+      new_bookings[code]["car"] = str(row["car"])
+    if price not in (None, ""):
+      new_bookings[code]["price"] = price
+    code += 1
+  # save the whole chunk at once
+  bookings.update(new_bookings)
+  return len(new_bookings), skipped
+
+# Function to import bookings from a CSV or JSON-lines file
+# (columns: name, start_date, end_date and optional car, price)
+def import_bookings(path):
+  imported = 0
+  skipped = 0
+  rows = []
+  for row in read_rows(path):
+    rows.append(row)
+    if len(rows) == chunk_size:
+      done, bad = import_chunk(rows)
+      imported += done
+      skipped += bad
+      rows = []
+  if rows:
+    done, bad = import_chunk(rows)
+    imported += done
+    skipped += bad
+  print(f"imported: {imported}, skipped: {skipped}")
+
+# Function to export all bookings to a CSV or JSON-lines file
+def export_bookings(path):
+  with open(path, "w", newline="") as file:
+    if path.endswith(".jsonl"):
+      for code, booking in bookings.items():
+        row = {
+          "code" : code,
+          "name" : booking["name"],
+          "start_date" : booking["start_date"].isoformat(),
+          "end_date" : booking["end_date"].isoformat(),
+          "days" : booking["days"],
+          "car" : booking.get("car", ""),
+          "price" : booking.get("price", "")
+        }
+        file.write(json.dumps(row) + "\n")
+    else:
+      writer = csv.writer(file)
+      writer.writerow(["code", "name", "start_date", "end_date", "days", "car", "price"])
+      for code, booking in bookings.items():
+        writer.writerow([code, booking["name"], booking["start_date"], booking["end_date"], booking["days"],
+                         booking.get("car", ""), booking.get("price", "")])
+  print(f"exported: {len(bookings)}")
+
 # Function to search for a booking using its code
 def search_by_code(code_s):
   if code_s in bookings:
@@ -141,31 +280,156 @@ def search():
 
 # Details to show a details of the cars
 def details():
-  num_booked_cars = len(bookings)
+  num_booked_cars = count_booked_cars()
   num_available_cars = total_cars - num_booked_cars
   print(f"Total number of cars: {total_cars}")
   print(f"number of booked: {num_booked_cars}")
   print(f"number of availabel: {num_available_cars}")
 
+# Function to compute occupancy, utilisation and revenue with a sweep line
+# every booking adds +1 on its start day and -1 on its end day, so the number
+# of booked cars only has to be recomputed where it actually changes
+def build_report():
+  changes = {}
+  car_intervals = {}
+  # bookings made without a car are not part of the utilisation per car
+  no_car_days = 0
+  no_car_bookings = 0
+  revenue = 0
+  first_day = None
+  last_day = None
+  for booking in bookings.values():
+    start = booking["start_date"].toordinal()
+    end = booking["end_date"].toordinal()
+    days = end - start
+    revenue += booking.get("price", days * price_per_day)
+    car = booking.get("car")
+    if car is None:
+      no_car_bookings += 1
+      no_car_days += days
+    else:
+      intervals = car_intervals.setdefault(car, [])
+      if days:
+        intervals.append((start, end))
+    if days == 0:
+      continue
+    changes[start] = changes.get(start, 0) + 1
+    changes[end] = changes.get(end, 0) - 1
+    if first_day is None or start < first_day:
+      first_day = start
+    if last_day is None or end > last_day:
+      last_day = end
+  # periods: (first day, day after the last day, number of booked cars)
+  periods = []
+  booked = 0
+  days_list = sorted(changes)
+  for i in range(len(days_list) - 1):
+    booked += changes[days_list[i]]
+    if periods and periods[-1][2] == booked:
+      periods[-1][1] = days_list[i + 1]
+    else:
+      periods.append([days_list[i], days_list[i + 1], booked])
+  # a car booked twice on the same days is used only once on those days,
+  # so the intervals of every car are merged before the days are added up
+  car_days = {}
+  overlaps = {}
+  for car, intervals in car_intervals.items():
+    intervals.sort()
+    used = 0
+    covered_until = None
+    for start, end in intervals:
+      if covered_until is not None and start < covered_until:
+        overlaps[car] = overlaps.get(car, 0) + 1
+        if end > covered_until:
+          used += end - covered_until
+          covered_until = end
+      else:
+        used += end - start
+        covered_until = end
+    car_days[car] = used
+  peak = max((period[2] for period in periods), default=0)
+  span = last_day - first_day if periods else 0
+  return {
+    "first_day" : first_day,
+    "last_day" : last_day,
+    "periods" : periods,
+    "peak" : peak,
+    "peak_periods" : [period for period in periods if period[2] == peak and peak > 0],
+    "utilisation" : {car: days / span for car, days in car_days.items()} if span else {},
+    "overlaps" : overlaps,
+    "no_car_bookings" : no_car_bookings,
+    "no_car_days" : no_car_days,
+    "revenue" : revenue
+  }
+
+# Function to print the report of the whole booking history
+def report(max_lines=20):
+  result = build_report()
+  if not result["periods"]:
+    print("empty")
+    return
+  to_date = datetime.date.fromordinal
+  print(f"from {to_date(result['first_day'])} to {to_date(result['last_day'] - 1)}")
+  print(f"revenue: {result['revenue']}")
+  print("daily occupancy:")
+  for first, after, booked in result["periods"][:max_lines]:
+    print(f"  {to_date(first)} .. {to_date(after - 1)} : {booked} booked")
+  if len(result["periods"]) > max_lines:
+    print(f"  ... {len(result['periods']) - max_lines} more periods")
+  print(f"peak: {result['peak']} booked")
+  for first, after, booked in result["peak_periods"][:max_lines]:
+    print(f"  {to_date(first)} .. {to_date(after - 1)}")
+  print("utilisation per car:")
+  cars = sorted(result["utilisation"].items(), key=lambda item: item[1], reverse=True)
+  for car, used in cars[:max_lines]:
+    print(f"  {car} : {used:.1%}")
+  if len(cars) > max_lines:
+    print(f"  ... {len(cars) - max_lines} more cars")
+  if result["overlaps"]:
+    print("bookings overlapping another booking of the same car:")
+    for car, count in sorted(result["overlaps"].items())[:max_lines]:
+      print(f"  {car} : {count}")
+    if len(result["overlaps"]) > max_lines:
+      print(f"  ... {len(result['overlaps']) - max_lines} more cars")
+  if result["no_car_bookings"]:
+    print(f"bookings without a car: {result['no_car_bookings']} ({result['no_car_days']} days)")
+
 # ----------------Main----------------
-while True:
-  command = input("Enter your option: ")
-  if command == "help":
-    help()
-  elif command == "booking":
-    booking()
-  elif command == "display":
-    display()
-  elif command == "search":
-    search()
-  elif command == "cancel":
-    code_del = int(input("enter your code: "))
-    cancel(code_del)
-  elif command == "details":
-    details()
-  elif command == "exit":
-    break
-  elif command == "":
-    continue
-  else:
-    print("command not found!")
\ No newline at end of file
+if __name__ == "__main__":
+  while True:
+    command = input("Enter your option: ")
+    if command == "help":
+      help()
+    elif command == "booking":
+      booking()
+    elif command == "display":
+      display()
+    elif command == "search":
+      search()
+    elif command == "cancel":
+      code_del = int(input("enter your code: "))
+      cancel(code_del)
+    elif command == "details":
+      details()
+    elif command == "report":
+      report()
+    elif command == "import":
+      path = input("file to import: ")
+      try:
+        import_bookings(path)
+      except OSError as error:
+        print(f"{path}: {error.strerror}!")
+      except (csv.Error, UnicodeDecodeError) as error:
+        print(f"{path}: invalid file ({error})!")
+    elif command == "export":
+      path = input("file to export: ")
+      try:
+        export_bookings(path)
+      except OSError as error:
+        print(f"{path}: {error.strerror}!")
+    elif command == "exit":
+      break
+    elif command == "":
+      continue
+    else:
+      print("command not found!")
\ No newline at end of file
@@ -0,0 +1,123 @@
+import os
+import time
+
+LOG_FILE = "commands.log"
+MAX_LOG_SIZE = 10 * 1024 * 1024 # bytes before commands.log is rotated
+LOG_BACKUPS = 5 # commands.log.1 ... commands.log.5
+BLOCK_SIZE = 64 * 1024
+
+
+# add one line: "<date> <time>: <command> (<seconds>s)"
+def write_entry(line, duration, path=LOG_FILE):
+    if os.path.exists(path) and os.path.getsize(path) >= MAX_LOG_SIZE:
+        rotate(path)
+    # time instead of datetime, it is already imported at startup
+    now = time.time()
+    time_now = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)) + f".{int(now % 1 * 1000000):06d}"
+    with open(path, "a") as file:
+        file.write(f"{time_now}: {line} ({duration:.6f}s)\n")
+
+
+# commands.log ==> commands.log.1 ==> commands.log.2 ... the oldest one is removed
+def rotate(path=LOG_FILE):
+    for i in range(LOG_BACKUPS - 1, 0, -1):
+        if os.path.exists(f"{path}.{i}"):
+            os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+    os.replace(path, f"{path}.1")
+
+
+# log files from the newest to the oldest
+def log_files(path=LOG_FILE):
+    files = [path] + [f"{path}.{i}" for i in range(1, LOG_BACKUPS + 1)]
+    return [name for name in files if os.path.exists(name)]
+
+
+# first offset whose line date is >= date (or > date when after is True)
+# lines are written in time order, so a binary search over the bytes works
+def find_offset(file, size, date, after=False):
+    date = date.encode()
+    low, high = 0, size
+    while low < high:
+        middle = (low + high) // 2
+        start = line_start(file, middle)
+        if start >= size:
+            high = middle
+            continue
+        file.seek(start)
+        line_date = file.readline()[:10]
+        if line_date > date or (line_date == date and not after):
+            high = middle
+        else:
+            low = middle + 1
+    return line_start(file, low)
+
+
+# start of the first line that begins at or after offset
+def line_start(file, offset):
+    if offset == 0:
+        return 0
+    file.seek(offset - 1)
+    file.readline()
+    return file.tell()
+
+
+def line_range(file, since=None, until=None):
+    size = file.seek(0, os.SEEK_END)
+    start = find_offset(file, size, since) if since else 0
+    end = find_offset(file, size, until, after=True) if until else size
+    return start, end
+
+
+# lines between start and end, the last one first
+def read_backwards(file, start, end):
+    rest = b""
+    position = end
+    while position > start:
+        size = min(BLOCK_SIZE, position - start)
+        position -= size
+        file.seek(position)
+        lines = (file.read(size) + rest).split(b"\n")
+        rest = lines.pop(0)
+        for line in reversed(lines):
+            if line:
+                yield line
+    if rest:
+        yield rest
+
+
+# lines between start and end, in order
+def read_forwards(file, start, end):
+    file.seek(start)
+    while file.tell() < end:
+        line = file.readline()
+        if not line:
+            break
+        yield line.rstrip(b"\n")
+
+
+# print the log lines between since and until (YYYY-MM-DD, both included),
+# only the last `tail` of them when tail is given
+def show_entries(tail=None, since=None, until=None, path=LOG_FILE):
+    files = log_files(path)
+    if not files:
+        print("No logs available.")
+        return
+    if tail is None:
+        for name in reversed(files):
+            with open(name, "rb") as file:
+                start, end = line_range(file, since, until)
+                for line in read_forwards(file, start, end):
+                    print(line.decode())
+        return
+    lines = []
+    for name in files:
+        with open(name, "rb") as file:
+            start, end = line_range(file, since, until)
+            for line in read_backwards(file, start, end):
+                if len(lines) >= tail:
+                    break
+                lines.append(line)
+        if len(lines) >= tail:
+            break
+    for line in reversed(lines):
+        print(line.decode())
@@ -0,0 +1,74 @@
+import argparse
+import hashlib
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import weather_stream
+
+CONDITIONS = ["Sunny", "Partly Cloudy", "Cloudy", "Rainy", "Windy", "Snowy", "Thunderstorms"]
+
+
+# same record for the same city every time, for cities that are not in the data file
+def fake_record(city):
+    seed = hashlib.sha256(city.encode()).digest()
+    forecast = []
+    for i in range(5):
+        high = seed[i] % 35
+        forecast.append({
+            "date": f"2023-11-{7 + i:02d}",
+            "condition": CONDITIONS[seed[5 + i] % len(CONDITIONS)],
+            "high": high,
+            "low": high - seed[10 + i] % 10,
+        })
+    return {
+        "current_condition": CONDITIONS[seed[15] % len(CONDITIONS)],
+        "condition_percent": seed[16] % 101,
+        "forecast": forecast,
+    }
+
+
+# GET /weather/<city> answers with the record of that city
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep connections open between requests
+    data = {}
+
+    def do_GET(self):
+        prefix = "/weather/"
+        if not self.path.startswith(prefix):
+            self.send_error(404)
+            return
+        city = urllib.parse.unquote(self.path[len(prefix):])
+        record = self.data.get(city) or fake_record(city)
+        body = json.dumps(record).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# start the server in a background thread, port 0 picks a free port
+def start(port=0, source=None):
+    Handler.data = dict(weather_stream.iter_cities(source)) if source else {}
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="local weather provider for testing")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on")
+    parser.add_argument("--data", type=str, default="weather_data.json", help="file with known cities")
+    args = parser.parse_args()
+    server = start(args.port, args.data)
+    print(f"serving on http://127.0.0.1:{server.server_address[1]}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -1,23 +1,106 @@
-import argparse
-import json
 import sys
-import datetime
+import time
+# other modules are imported by the commands that use them, so a short
+# command like --city does not pay for argparse, numpy or asyncio
+
+# int of at least 1, argparse names it in its error ("invalid positive value")
+def positive(text):
+    value = int(text)
+    if value < 1:
+        raise ValueError(f"{text} is less than 1")
+    return value
+
+# int of at least 0 ("invalid non_negative value")
+def non_negative(text):
+    value = int(text)
+    if value < 0:
+        raise ValueError(f"{text} is less than 0")
+    return value
+
+# date written as YYYY-MM-DD, the log lines are compared with it byte by byte,
+# so "2026-1-5" would be wrong too ("invalid day value")
+def day(text):
+    if len(text) != 10 or text[4] != "-" or text[7] != "-" or text.replace("-", "").strip("0123456789"):
+        raise ValueError(f"{text} is not YYYY-MM-DD")
+    time.strptime(text, "%Y-%m-%d")
+    return text
+
+# flag, type (None for on/off flags), default, help
+OPTIONS = [
+    ("--all", None, False, "Display all data"),
+    ("--city", str, None, "Get name of the city"),
+    ("--forecast", None, False, "forecast 5-days"),
+    ("--details", None, False, "Display details"),
+    ("--summary", None, False, "Display the cached summary of the city"),
+    ("--show-logs", None, False, "show all logs of the program"),
+    ("--tail", positive, None, "only the last N logs"),
+    ("--since", day, None, "logs from this date (YYYY-MM-DD)"),
+    ("--until", day, None, "logs up to this date (YYYY-MM-DD)"),
+    ("--analytics", str, None, "statistics over all cities: hottest, range or conditions"),
+    ("--top", positive, 10, "number of cities for --analytics hottest"),
+    ("--refresh", None, False, "fetch all cities from the weather provider"),
+    ("--provider", str, None, "base URL of the weather provider"),
+    ("--ttl", non_negative, 600, "seconds a fetched city stays fresh"),
+    ("--concurrency", positive, 32, "open connections to the provider"),
+]
+ANALYTICS = ["hottest", "range", "conditions"]
+
 def setup():
+    import argparse
     parser = argparse.ArgumentParser(description="weather forecast CLI")
-    parser.add_argument("--all", action="store_true", help="Display all data")
-    parser.add_argument("--city", type=str, help="Get name of the city")
-    parser.add_argument("--forecast",action="store_true", help="forecast 5-days")
-    parser.add_argument("--details",action="store_true", help="Display details")
-    parser.add_argument("--show-logs",action="store_true", help="show all logs of the program")
+    for flag, kind, default, text in OPTIONS:
+        if kind is None:
+            parser.add_argument(flag, action="store_true", help=text)
+        elif flag == "--analytics":
+            parser.add_argument(flag, choices=ANALYTICS, help=text)
+        else:
+            parser.add_argument(flag, type=kind, default=default, help=text)
     return parser
 
-def load_data():
-    with open("weather_data.json", "r") as file:
-        data = json.load(file)
-    return data
+class Args:
+    pass
+
+# parse the usual command lines without argparse, None means "let argparse do it"
+# (help, unknown options and wrong values are all left to argparse)
+def parse_fast(argv):
+    options = {flag: (kind, default) for flag, kind, default, text in OPTIONS}
+    args = Args()
+    for flag, (kind, default) in options.items():
+        setattr(args, flag[2:].replace("-", "_"), default)
+    i = 0
+    while i < len(argv):
+        flag, _, value = argv[i].partition("=")
+        if flag not in options:
+            return None
+        kind = options[flag][0]
+        if kind is None:
+            if value:
+                return None
+            value = True
+        else:
+            if not value:
+                i += 1
+                if i >= len(argv):
+                    return None
+                value = argv[i]
+                # "--city --all" is a missing value for argparse, not a city named "--all"
+                if value.startswith("--"):
+                    return None
+            try:
+                value = kind(value)
+            except ValueError:
+                return None
+        setattr(args, flag[2:].replace("-", "_"), value)
+        i += 1
+    if args.analytics is not None and args.analytics not in ANALYTICS:
+        return None
+    return args
 
-def display_all(data):
-    for city, value in data.items():
+# cities is an iterable of (city, record) pairs, so it can be printed while it is read
+# every pair is printed: --all passes the store, which has one row per city (a city
+# listed twice in weather_data.json shows once, with its last record, like --city)
+def display_all(cities):
+    for city, value in cities:
         print(f"{city}: {value['condition_percent']}% {value['current_condition']}")
 
 def display_forecast(city, data):
@@ -32,24 +115,39 @@ def display_details(city, data):
     print(f"  condition_percent : {data[city]['condition_percent']}%")
     display_forecast(city, data)
 
-def log_command(line):
-    with open("commands.log", "a") as file:
-        time_now = datetime.datetime.now().strftime("%Y-%m-%d")
-        file.write(f"{time_now}: {line}\n")
+def display_summary(city, summary):
+    if summary is None:
+        print(f"{city}: not found!")
+        return
+    print(f"Weather summary for {city}")
+    print(f"  current_condition : {summary['current_condition']}")
+    print(f"  condition_percent : {summary['condition_percent']}%")
+    print(f"  forecast low/high : {summary['low']} / {summary['high']}")
+    print(f"  dominant_condition : {summary['dominant_condition']}")
 
-def show_logs():
-    with open("commands.log", "r") as file:
-        print(file.read())
-#.........main.............
-parser = setup()
-args = parser.parse_args()
-command_line = " ".join(sys.argv)
-log_command(command_line)
-data = load_data()
-if args.all:
-    display_all(data)
-elif args.city:
+def log_command(line, duration):
+    import command_log
+    command_log.write_entry(line, duration)
+
+def show_logs(tail=None, since=None, until=None):
+    import command_log
+    command_log.show_entries(tail, since, until)
+
+#.........commands.............
+# --all and --analytics read the store, so cities fetched by --refresh are included
+def run_all(args):
+    import weather_store
+    display_all(weather_store.iter_cities(weather_store.open_store()))
+
+def run_city(args):
+    import weather_store
     name = args.city
+    if args.summary:
+        display_summary(name, weather_store.get_summary(weather_store.open_store(), name))
+        return
+    # read only this city from the indexed store
+    record = weather_store.get_city(weather_store.open_store(), name)
+    data = {} if record is None else {name: record}
     if name not in data:
         print(f"{name}: not found!")
     elif args.forecast:
@@ -58,8 +156,56 @@ elif args.city:
         display_details(name, data)
     else:
         print(f"Currect condition in {name}: {data[name]['current_condition']}")
-elif args.show_logs:
-    show_logs()
 
+def run_analytics(args):
+    import weather_analytics
+    import weather_store
+    weather_analytics.display_analytics(args.analytics, weather_store.iter_cities(weather_store.open_store()), args.top)
+
+def run_refresh(args):
+    import os
+    import weather_ingest
+    import weather_store
+    provider = args.provider or os.environ.get("WEATHER_PROVIDER", weather_ingest.DEFAULT_PROVIDER)
+    try:
+        result = weather_ingest.refresh(weather_store.open_store(), provider, ttl=args.ttl, concurrency=args.concurrency)
+    except ValueError as error:
+        print(f"{error}!")
+        return
+    print(f"fetched: {result['fetched']}, fresh: {result['fresh']}, failed: {result['failed']}")
+
+def run_show_logs(args):
+    show_logs(args.tail, args.since, args.until)
 
+# the first option that is set picks the command
+COMMANDS = [
+    ("all", run_all),
+    ("city", run_city),
+    ("analytics", run_analytics),
+    ("refresh", run_refresh),
+    ("show_logs", run_show_logs),
+]
 
+def run(args):
+    for option, command in COMMANDS:
+        if getattr(args, option):
+            command(args)
+            return
+
+def main(argv):
+    args = parse_fast(argv[1:])
+    if args is None:
+        args = setup().parse_args(argv[1:])
+    # these options only filter the logs, so they show them too
+    if args.tail is not None or args.since is not None or args.until is not None:
+        args.show_logs = True
+    command_line = " ".join(argv)
+    start = time.perf_counter()
+    try:
+        run(args)
+    finally:
+        log_command(command_line, time.perf_counter() - start)
+
+#.........main.............
+if __name__ == "__main__":
+    main(sys.argv)
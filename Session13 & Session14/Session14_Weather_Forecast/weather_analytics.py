@@ -0,0 +1,82 @@
+import numpy as np
+
+
+# put every forecast day of every city in columns (one row per city and day)
+# cities is an iterable of (city, record) pairs, e.g. weather_store.iter_cities
+# rows of the same city are next to each other, city_start[i] is the first row of city i
+def load_columns(cities_data):
+    cities = []
+    city_start = []
+    dates = []
+    highs = []
+    lows = []
+    codes = []
+    condition_codes = {}
+    for city, value in cities_data:
+        forecast = value.get("forecast", [])
+        if not forecast:
+            continue
+        cities.append(city)
+        city_start.append(len(dates))
+        for day in forecast:
+            dates.append(day["date"])
+            highs.append(day["high"])
+            lows.append(day["low"])
+            codes.append(condition_codes.setdefault(day["condition"], len(condition_codes)))
+    return {
+        "cities": np.array(cities, dtype=object),
+        "city_start": np.array(city_start, dtype=np.int64),
+        "date": np.array(dates, dtype="datetime64[D]"),
+        "high": np.array(highs, dtype=np.float64),
+        "low": np.array(lows, dtype=np.float64),
+        "condition": np.array(codes, dtype=np.int32),
+        "conditions": np.array(list(condition_codes), dtype=object),
+    }
+
+
+# the n cities with the highest forecast temperature, hottest first
+def hottest(columns, n=10):
+    if len(columns["cities"]) == 0 or n < 1:
+        return []
+    city_high = np.maximum.reduceat(columns["high"], columns["city_start"])
+    n = min(n, len(city_high))
+    top = np.argpartition(-city_high, n - 1)[:n]
+    top = top[np.argsort(-city_high[top], kind="stable")]
+    return list(zip(columns["cities"][top], city_high[top]))
+
+
+# mean of (high - low) over all cities for every date
+def mean_range_by_day(columns):
+    days, day_index = np.unique(columns["date"], return_inverse=True)
+    total = np.bincount(day_index, weights=columns["high"] - columns["low"], minlength=len(days))
+    count = np.bincount(day_index, minlength=len(days))
+    return list(zip(days.astype(str), total / count))
+
+
+# how many cities have each condition on every date
+def condition_frequency(columns):
+    days, day_index = np.unique(columns["date"], return_inverse=True)
+    n_conditions = len(columns["conditions"])
+    counts = np.bincount(
+        day_index * n_conditions + columns["condition"],
+        minlength=len(days) * n_conditions,
+    ).reshape(len(days), n_conditions)
+    return days.astype(str), columns["conditions"], counts
+
+
+def display_analytics(query, cities_data, n=10):
+    columns = load_columns(cities_data)
+    if query == "hottest":
+        print(f"{n} hottest cities")
+        for city, high in hottest(columns, n):
+            print(f"  {city}: {high:g}")
+    elif query == "range":
+        print("mean range per day")
+        for day, mean_range in mean_range_by_day(columns):
+            print(f"  {day}: {mean_range:.2f}")
+    elif query == "conditions":
+        days, conditions, counts = condition_frequency(columns)
+        print("conditions per day")
+        for day, row in zip(days, counts):
+            found = ", ".join(f"{name}: {count}" for name, count in zip(conditions, row) if count)
+            print(f"  {day}: {found}")
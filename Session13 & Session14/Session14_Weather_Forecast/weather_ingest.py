@@ -0,0 +1,139 @@
+import asyncio
+import json
+import time
+import urllib.parse
+
+DEFAULT_PROVIDER = "http://127.0.0.1:8765"
+DEFAULT_TTL = 600
+DEFAULT_CONCURRENCY = 32
+TIMEOUT = 10 # seconds to connect, or to get one response, before a city fails
+RECORD_KEYS = ("current_condition", "condition_percent", "forecast")
+DAY_KEYS = ("date", "condition", "high", "low")
+
+
+# a reply the commands can show, like the cities of weather_data.json
+# (an error body such as {"error": "rate limited"} is not a record)
+def valid_record(record):
+    if not isinstance(record, dict) or any(key not in record for key in RECORD_KEYS):
+        return False
+    forecast = record["forecast"]
+    return isinstance(forecast, list) and all(
+        isinstance(day, dict) and all(key in day for key in DAY_KEYS) for day in forecast
+    )
+
+
+# one kept-alive HTTP/1.1 connection to the provider, plain http only
+class Connection:
+    def __init__(self, host, port, timeout=TIMEOUT):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+
+    async def get(self, path):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout)
+        return await asyncio.wait_for(self.exchange(path), self.timeout)
+
+    async def exchange(self, path):
+        request = f"GET {path} HTTP/1.1\r\nHost: {self.host}\r\nConnection: keep-alive\r\n\r\n"
+        self.writer.write(request.encode())
+        await self.writer.drain()
+        status = (await self.reader.readline()).decode().split()
+        if len(status) < 2:
+            raise ConnectionError("connection closed by provider")
+        length = None
+        keep_alive = True
+        while True:
+            line = (await self.reader.readline()).decode().strip()
+            if not line:
+                break
+            key, _, value = line.partition(":")
+            key = key.lower()
+            if key == "content-length":
+                length = int(value)
+            elif key == "connection" and value.strip().lower() == "close":
+                keep_alive = False
+        # chunked replies are not supported, and reading them as empty would
+        # leave the rest of the reply in the kept-alive connection
+        if length is None:
+            raise ValueError("reply without Content-Length")
+        body = await self.reader.readexactly(length)
+        if not keep_alive:
+            self.close()
+        return int(status[1]), body
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = None
+        self.writer = None
+
+
+# fetch the records of the cities with at most `concurrency` open connections
+# returns ({city: record}, [cities that failed])
+async def fetch_cities(base_url, cities, concurrency=DEFAULT_CONCURRENCY):
+    url = urllib.parse.urlsplit(base_url)
+    if url.scheme != "http" or not url.hostname:
+        raise ValueError(f"{base_url}: only http:// providers are supported")
+    host = url.hostname
+    port = url.port or 80
+    queue = asyncio.Queue()
+    for city in cities:
+        queue.put_nowait(city)
+    records = {}
+    failed = []
+
+    async def worker():
+        connection = Connection(host, port)
+        while not queue.empty():
+            city = queue.get_nowait()
+            path = f"{url.path.rstrip('/')}/weather/{urllib.parse.quote(city, safe='')}"
+            # a kept-alive connection may have been closed by the server, retry once
+            for attempt in range(2):
+                try:
+                    status, body = await connection.get(path)
+                    record = json.loads(body) if status == 200 else None
+                    if valid_record(record):
+                        records[city] = record
+                    else:
+                        failed.append(city)
+                    break
+                except asyncio.TimeoutError:
+                    # a provider that does not answer is not asked twice
+                    connection.close()
+                    failed.append(city)
+                    break
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    connection.close()
+                    if attempt == 1:
+                        failed.append(city)
+        connection.close()
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(cities)) or 1)))
+    return records, failed
+
+
+# fetch every city that is not in the cache or is older than ttl seconds,
+# save it in the cache and in the cities of the store
+def refresh(db, base_url=DEFAULT_PROVIDER, cities=None, ttl=DEFAULT_TTL, concurrency=DEFAULT_CONCURRENCY):
+    if cities is None:
+        cities = [name for (name,) in db.execute("SELECT name FROM cities")]
+    now = time.time()
+    fresh = {
+        name for name, fetched_at in db.execute("SELECT name, fetched_at FROM provider_cache")
+        if now - fetched_at < ttl
+    }
+    stale = [city for city in cities if city not in fresh]
+    records, failed = asyncio.run(fetch_cities(base_url, stale, concurrency))
+    rows = [(city, now, json.dumps(record)) for city, record in records.items()]
+    with db:
+        db.executemany("INSERT OR REPLACE INTO provider_cache VALUES (?, ?, ?)", rows)
+        db.executemany(
+            "INSERT INTO cities VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET record = excluded.record",
+            [(city, record) for city, _, record in rows],
+        )
+        db.executemany("DELETE FROM summaries WHERE name = ?", [(city,) for city in records])
+    return {"fetched": len(records), "fresh": len(cities) - len(stale), "failed": len(failed)}
@@ -0,0 +1,124 @@
+import json
+import os
+import sqlite3
+import time
+
+import weather_stream
+
+SOURCE_FILE = "weather_data.json"
+STORE_FILE = "weather_data.db"
+SUMMARY_CACHE_SIZE = 1000 # city summaries kept, the least recently used go first
+PROVIDER_TTL = 600 # seconds a fetched record wins over the JSON file on a rebuild
+TOUCH_INTERVAL = 60 # seconds before a hit writes its new last use again
+
+
+# open the indexed copy of the weather data, rebuilding it if the source changed
+def open_store(source=SOURCE_FILE, path=STORE_FILE):
+    db = sqlite3.connect(path)
+    # the store can always be rebuilt, so commits (like the summary cache
+    # keeping its last use) do not have to wait for the disk
+    db.execute("PRAGMA journal_mode = WAL")
+    db.execute("PRAGMA synchronous = NORMAL")
+    db.execute("CREATE TABLE IF NOT EXISTS cities (name TEXT PRIMARY KEY, record TEXT NOT NULL)")
+    db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    # records fetched from a weather provider, see weather_ingest.py
+    db.execute("""CREATE TABLE IF NOT EXISTS provider_cache (
+        name TEXT PRIMARY KEY, fetched_at REAL NOT NULL, record TEXT NOT NULL)""")
+    db.execute("""CREATE TABLE IF NOT EXISTS summaries (
+        name TEXT PRIMARY KEY, summary TEXT NOT NULL, last_used REAL NOT NULL)""")
+    db.execute("CREATE INDEX IF NOT EXISTS summaries_last_used ON summaries (last_used)")
+    stat = os.stat(source)
+    version = f"{stat.st_mtime_ns}:{stat.st_size}"
+    row = db.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+    if row is None or row[0] != version:
+        # a new mtime with the same content (e.g. after touch or a copy) keeps the store
+        digest = file_hash(source)
+        row = db.execute("SELECT value FROM meta WHERE key = 'hash'").fetchone()
+        if row is None or row[0] != digest:
+            rebuild(db, source)
+        with db:
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('source', ?)", (version,))
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('hash', ?)", (digest,))
+    return db
+
+
+def file_hash(path):
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# copy every city of the JSON source into the store, records fetched in the last
+# PROVIDER_TTL seconds win over the file (a city listed twice keeps its first place and
+# its last record, like json.load)
+def rebuild(db, source):
+    with db:
+        db.execute("DELETE FROM cities")
+        db.execute("DELETE FROM summaries")
+        db.executemany(
+            "INSERT INTO cities VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET record = excluded.record",
+            ((city, json.dumps(value)) for city, value in weather_stream.iter_cities(source)),
+        )
+        db.execute(
+            """INSERT INTO cities SELECT name, record FROM provider_cache WHERE fetched_at > ?
+            ON CONFLICT (name) DO UPDATE SET record = excluded.record""",
+            (time.time() - PROVIDER_TTL,),
+        )
+
+
+# return the record of one city, or None if it is not in the store
+def get_city(db, name):
+    row = db.execute("SELECT record FROM cities WHERE name = ?", (name,)).fetchone()
+    if row is None:
+        return None
+    return json.loads(row[0])
+
+
+# yield (city, record) pairs of the whole store, fetched records included,
+# one row at a time in the order the cities were stored
+def iter_cities(db):
+    for name, record in db.execute("SELECT name, record FROM cities ORDER BY rowid"):
+        yield name, json.loads(record)
+
+
+# current condition, forecast min/max and most common forecast condition of a city
+def summarize(record):
+    forecast = record.get("forecast", [])
+    conditions = {}
+    for day in forecast:
+        conditions[day["condition"]] = conditions.get(day["condition"], 0) + 1
+    return {
+        "current_condition": record["current_condition"],
+        "condition_percent": record["condition_percent"],
+        "low": min((day["low"] for day in forecast), default=None),
+        "high": max((day["high"] for day in forecast), default=None),
+        "dominant_condition": max(conditions, key=conditions.get, default=None),
+    }
+
+
+# summary of a city from the cache, computed and saved on the first request
+# (a hit only writes when its last use is older than TOUCH_INTERVAL, so the
+# eviction order is exact to that interval and most hits are plain reads)
+def get_summary(db, name):
+    now = time.time()
+    row = db.execute("SELECT summary, last_used FROM summaries WHERE name = ?", (name,)).fetchone()
+    if row is not None:
+        if now - row[1] >= TOUCH_INTERVAL:
+            with db:
+                db.execute("UPDATE summaries SET last_used = ? WHERE name = ?", (now, name))
+        return json.loads(row[0])
+    record = get_city(db, name)
+    if record is None:
+        return None
+    summary = summarize(record)
+    with db:
+        db.execute("INSERT OR REPLACE INTO summaries VALUES (?, ?, ?)", (name, json.dumps(summary), now))
+        db.execute(
+            """DELETE FROM summaries WHERE name IN (
+                SELECT name FROM summaries ORDER BY last_used DESC LIMIT -1 OFFSET ?)""",
+            (SUMMARY_CACHE_SIZE,),
+        )
+    return summary
@@ -0,0 +1,86 @@
+import json
+
+CHUNK_SIZE = 64 * 1024
+
+decoder = json.JSONDecoder()
+
+
+# yield (city, record) pairs one by one, reading the file a chunk at a time
+# works with {"city": {...}, ...} files and with JSON-lines files where every
+# line is {"city": {...}}
+def iter_cities(path):
+    if path.endswith(".jsonl"):
+        yield from iter_lines(path)
+    else:
+        yield from iter_object(path)
+
+
+def iter_lines(path):
+    with open(path, "r") as file:
+        for line in file:
+            if line.strip():
+                yield from json.loads(line).items()
+
+
+def iter_object(path):
+    with open(path, "r") as file:
+        reader = Reader(file)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            city = reader.value()
+            reader.expect(":")
+            yield city, reader.value()
+            if reader.peek() == "}":
+                return
+            reader.expect(",")
+
+
+# keeps only the part of the file that is not parsed yet
+class Reader:
+    def __init__(self, file):
+        self.file = file
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def more(self):
+        chunk = self.file.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def skip_spaces(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return
+            self.more()
+
+    def peek(self):
+        self.skip_spaces()
+        if self.pos >= len(self.buffer):
+            raise ValueError("unexpected end of weather data")
+        return self.buffer[self.pos]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"expected '{char}' at '{self.buffer[self.pos:self.pos + 20]}'")
+        self.pos += 1
+
+    def value(self):
+        self.skip_spaces()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+                # a number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.more()
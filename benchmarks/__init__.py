@@ -0,0 +1,23 @@
+"""
+Benchmarks and synthetic workloads for the command line tools of the course.
+
+The tools are driven through their functions, never through input() prompts:
+
+    python -m benchmarks --size small --output report.json
+    python -m benchmarks --size large --compare old_report.json
+
+``startup.py`` is a separate cold-start (import time) check.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PRODUCTS_DIR = os.path.join(ROOT, "Session07 & Session08")
+BOOKINGS_DIR = os.path.join(ROOT, "Session09 & Session10")
+WEATHER_DIR = os.path.join(ROOT, "Session13 & Session14", "Session14_Weather_Forecast")
+PYCOMMANDER_DIR = os.path.join(ROOT, "Final_Projects", "Python_Basic")
+
+# the tools are plain scripts next to their modules, not installed packages
+for directory in (PRODUCTS_DIR, BOOKINGS_DIR, WEATHER_DIR, PYCOMMANDER_DIR):
+    if directory not in sys.path:
+        sys.path.append(directory)
@@ -0,0 +1,94 @@
+"""
+Run the benchmarks and write a JSON report.
+
+Usage:
+    python -m benchmarks [--size small|large] [--tools products,bookings,...]
+                         [--output report.json] [--compare old_report.json]
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import ROOT, bench_bookings, bench_products, bench_pycommander, bench_weather, workloads
+
+TOOLS = {
+    "products": bench_products,
+    "bookings": bench_bookings,
+    "weather": bench_weather,
+    "pycommander": bench_pycommander,
+}
+
+
+def git_version():
+    """Return the short commit hash of the repository, or None outside git."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def compare(old, new):
+    """
+    Print the throughput of every benchmark against an older report.
+
+    Args:
+        old (dict): The older report.
+        new (dict): The report of this run.
+    """
+    print(f"compared with {old.get('version')} ({old.get('size')})")
+    for tool, entries in new["results"].items():
+        before = {entry["name"]: entry for entry in old.get("results", {}).get(tool, [])}
+        for entry in entries:
+            previous = before.get(entry["name"])
+            if not previous or not previous.get("throughput") or not entry.get("throughput"):
+                continue
+            ratio = entry["throughput"] / previous["throughput"]
+            print(f"  {tool}.{entry['name']:<32} {ratio:6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmarks of the course CLI tools")
+    parser.add_argument("--size", choices=sorted(workloads.SIZES), default="small", help="size of the workloads")
+    parser.add_argument("--tools", default=",".join(TOOLS), help="comma separated tools to run")
+    parser.add_argument("--output", help="file for the JSON report, printed when missing")
+    parser.add_argument("--compare", help="older JSON report to compare with")
+    args = parser.parse_args()
+
+    size = workloads.SIZES[args.size]
+    report = {
+        "version": git_version(),
+        "size": args.size,
+        "workload": size,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": {},
+    }
+    for tool in args.tools.split(","):
+        if tool not in TOOLS:
+            parser.error(f"unknown tool: {tool}")
+        print(f"running {tool} ...", file=sys.stderr)
+        with tempfile.TemporaryDirectory() as workdir:
+            report["results"][tool] = TOOLS[tool].run(size, workdir)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, "r") as file:
+            compare(json.load(file), report)
+
+
+if __name__ == "__main__":
+    main()
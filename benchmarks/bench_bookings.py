@@ -0,0 +1,42 @@
+"""Car booking: bulk import and export, date validation and the fleet report."""
+import os
+
+from benchmarks import harness, workloads
+
+
+def run(size, workdir):
+    """
+    Benchmark the car booking functions.
+
+    Args:
+        size (dict): Workload size, see workloads.SIZES.
+        workdir (str): Empty directory for the files of the benchmark.
+
+    Returns:
+        list: Report entries.
+    """
+    import Session10_BookingCars as booking
+
+    count = size["bookings"]
+    source = os.path.join(workdir, "bookings.csv")
+    workloads.write_bookings(source, count)
+    booking.bookings.clear()
+    booking.date_cache.clear()
+    booking.code = 1
+
+    results = []
+    results.append(harness.measure_bulk("import_bookings", lambda: booking.import_bookings(source), count))
+    results.append(harness.measure_bulk("build_report", booking.build_report, count))
+    results.append(harness.measure_bulk(
+        "export_bookings.csv", lambda: booking.export_bookings(os.path.join(workdir, "out.csv")), count))
+    results.append(harness.measure_bulk(
+        "export_bookings.jsonl", lambda: booking.export_bookings(os.path.join(workdir, "out.jsonl")), count))
+
+    dates = [f"2023-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)]
+    booking.date_cache.clear()
+    results.append(harness.measure("parse_dates.batch_of_1000", booking.parse_dates, [dates * 3] * 100))
+    results.append(harness.measure("validate_date", booking.validate_date, dates * 10))
+    codes = list(booking.bookings)[:10000]
+    results.append(harness.measure("search_by_code", booking.search_by_code, codes))
+    booking.bookings.clear()
+    return results
@@ -0,0 +1,62 @@
+"""Product manager: in-memory catalog, search index, persistent catalog and batch mode."""
+import os
+import random
+
+from benchmarks import harness, workloads
+
+
+def run(size, workdir):
+    """
+    Benchmark the product catalog.
+
+    Args:
+        size (dict): Workload size, see workloads.SIZES.
+        workdir (str): Empty directory for the files of the benchmark.
+
+    Returns:
+        list: Report entries.
+    """
+    from catalog_store import PersistentCatalog
+    from product_batch import run_batch
+    from product_catalog import Catalog
+
+    rng = random.Random(0)
+    names = workloads.product_names(size["products"])
+    sample = rng.sample(names, min(10000, len(names)))
+    results = []
+
+    catalog = Catalog()
+    results.append(harness.measure("catalog.add", catalog.add, names))
+    results.append(harness.measure("catalog.get", catalog.get, sample))
+    results.append(harness.measure(
+        "catalog.buy", lambda name: catalog.buy(name, rng.randrange(1, 1000)), sample))
+    results.append(harness.measure(
+        "catalog.rename", lambda name: catalog.rename(name, name + " v2"), sample[:1000]))
+    results.append(harness.measure(
+        "catalog.details", lambda _: (catalog.prices.min(), catalog.prices.max(), catalog.prices.mean()),
+        range(1000)))
+    results.append(harness.measure("catalog.remove", catalog.remove, sample[1000:]))
+
+    queries = [name[:rng.randrange(3, 8)] for name in sample[:500]]
+    queries += [workloads.misspell(name, rng) for name in sample[500:1000]]
+    results.append(harness.measure_bulk(
+        "search.build_index", lambda: catalog.find("warm up"), len(catalog)))
+    results.append(harness.measure("search.find", catalog.find, queries))
+
+    path = os.path.join(workdir, "products.db")
+    batch_file = os.path.join(workdir, "operations.csv")
+    ops = workloads.write_product_batch(batch_file, names)
+    store = PersistentCatalog(path)
+    results.append(harness.measure_bulk("batch.run", lambda: run_batch(store, batch_file), ops))
+    store.close()
+
+    opened = []
+    results.append(harness.measure_bulk("store.open", lambda: opened.append(PersistentCatalog(path)), 1))
+    store = opened[0]
+    results.append(harness.measure("store.get", store.get, sample))
+    results.append(harness.measure_bulk("store.build_index", lambda: store.find("warm up"), len(store)))
+    results.append(harness.measure("store.find", store.find, queries))
+    results.append(harness.measure(
+        "store.buy", lambda name: store.buy(name, rng.randrange(1, 1000)), sample[:2000]))
+    store.close()
+    return results
@@ -0,0 +1,45 @@
+"""PyCommander: listing, finding and reading files in a deep directory tree."""
+import os
+
+from benchmarks import harness, workloads
+
+
+def run(size, workdir):
+    """
+    Benchmark the PyCommander functions.
+
+    PyCommander keeps its state (path.json, logs.log) in the current
+    directory, so the benchmark runs inside workdir.
+
+    Args:
+        size (dict): Workload size, see workloads.SIZES.
+        workdir (str): Empty directory for the files of the benchmark.
+
+    Returns:
+        list: Report entries.
+    """
+    import Final_Project as pycommander
+
+    depth, width = size["tree"]
+    tree = os.path.join(workdir, "tree")
+    os.makedirs(tree)
+    directories = workloads.make_tree(tree, depth, width)
+    relative = [os.path.relpath(directory, workdir) for directory in directories]
+    sample = relative[:: max(1, len(relative) // 2000)]
+
+    previous = os.getcwd()
+    os.chdir(workdir)
+    try:
+        results = []
+        results.append(harness.measure_bulk(
+            "find_matching_files", lambda: pycommander.find_matching_files(tree, "file1"), len(directories)))
+        results.append(harness.measure("list_directory", pycommander.list_directory, sample))
+        results.append(harness.measure(
+            "cat_file", lambda directory: pycommander.cat_file(os.path.join(directory, "file0.txt")), sample))
+        results.append(harness.measure(
+            "load_working_directory", lambda _: pycommander.load_working_directory(), range(2000)))
+        results.append(harness.measure(
+            "log_command", lambda _: pycommander.log_command("ls", "Success"), range(2000)))
+    finally:
+        os.chdir(previous)
+    return results
@@ -0,0 +1,74 @@
+"""Weather forecast: streaming, indexed store, summary cache, analytics and ingestion."""
+import os
+import random
+
+from benchmarks import harness, workloads
+
+# cities fetched from the local mock provider
+INGEST_CITIES = 2000
+
+
+def run(size, workdir):
+    """
+    Benchmark the weather modules.
+
+    Args:
+        size (dict): Workload size, see workloads.SIZES.
+        workdir (str): Empty directory for the files of the benchmark.
+
+    Returns:
+        list: Report entries.
+    """
+    import mock_provider
+    import weather_ingest
+    import weather_store
+    import weather_stream
+
+    count = size["cities"]
+    source = os.path.join(workdir, "weather_data.json")
+    cities = workloads.write_weather(source, count)
+    sample = random.Random(0).sample(cities, min(5000, count))
+    results = []
+
+    results.append(harness.measure_bulk(
+        "iter_cities", lambda: sum(1 for _ in weather_stream.iter_cities(source)), count))
+    stores = []
+    path = os.path.join(workdir, "weather_data.db")
+    results.append(harness.measure_bulk(
+        "open_store.rebuild", lambda: stores.append(weather_store.open_store(source, path)), count))
+    db = stores[0]
+    results.append(harness.measure_bulk(
+        "open_store.unchanged", lambda: weather_store.open_store(source, path).close(), 1))
+    results.append(harness.measure("get_city", lambda city: weather_store.get_city(db, city), sample))
+    # no more cities than the cache holds, or the hot pass would be misses and evictions
+    cached = sample[:weather_store.SUMMARY_CACHE_SIZE]
+    results.append(harness.measure("get_summary.cold", lambda city: weather_store.get_summary(db, city), cached))
+    results.append(harness.measure("get_summary.hot", lambda city: weather_store.get_summary(db, city), cached))
+
+    try:
+        import weather_analytics
+    except ImportError:
+        results.append(harness.skipped("analytics", "numpy is not installed"))
+    else:
+        columns = []
+        results.append(harness.measure_bulk(
+            "analytics.load_columns",
+            lambda: columns.append(weather_analytics.load_columns(weather_store.iter_cities(db))), count))
+        results.append(harness.measure_bulk(
+            "analytics.hottest", lambda: weather_analytics.hottest(columns[0], 10), count))
+        results.append(harness.measure_bulk(
+            "analytics.mean_range_by_day", lambda: weather_analytics.mean_range_by_day(columns[0]), count))
+        results.append(harness.measure_bulk(
+            "analytics.condition_frequency", lambda: weather_analytics.condition_frequency(columns[0]), count))
+
+    server = mock_provider.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    fetched = cities[:INGEST_CITIES]
+    results.append(harness.measure_bulk(
+        "ingest.refresh", lambda: weather_ingest.refresh(db, url, fetched, ttl=0), len(fetched)))
+    results.append(harness.measure_bulk(
+        "ingest.refresh_cached", lambda: weather_ingest.refresh(db, url, fetched, ttl=3600), len(fetched)))
+    server.shutdown()
+    server.server_close()
+    db.close()
+    return results
@@ -0,0 +1,93 @@
+"""Timing helpers shared by every benchmark."""
+import contextlib
+import io
+import time
+
+
+def percentile(sorted_values, fraction):
+    """
+    Return a percentile of already sorted values (nearest rank).
+
+    Args:
+        sorted_values (list): Values in increasing order.
+        fraction (float): Percentile between 0 and 1, e.g. 0.99.
+
+    Returns:
+        float: The value at that rank, or 0 for an empty list.
+    """
+    if not sorted_values:
+        return 0
+    rank = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def measure(name, func, items):
+    """
+    Call func once per item and time every call.
+
+    Args:
+        name (str): Name of the operation in the report.
+        func (callable): Operation, called as func(item).
+        items (iterable): Inputs of the operation.
+
+    Returns:
+        dict: Operation count, total seconds, throughput and latency percentiles.
+    """
+    latencies = []
+    clock = time.perf_counter_ns
+    with quiet():
+        for item in items:
+            start = clock()
+            func(item)
+            latencies.append(clock() - start)
+    total = sum(latencies) / 1e9
+    latencies.sort()
+    return {
+        "name": name,
+        "ops": len(latencies),
+        "seconds": round(total, 6),
+        "throughput": round(len(latencies) / total, 1) if total else None,
+        "p50_us": round(percentile(latencies, 0.50) / 1000, 3),
+        "p90_us": round(percentile(latencies, 0.90) / 1000, 3),
+        "p99_us": round(percentile(latencies, 0.99) / 1000, 3),
+        "max_us": round(latencies[-1] / 1000, 3) if latencies else 0,
+    }
+
+
+def measure_bulk(name, func, ops):
+    """
+    Time one call that handles many operations at once (an import, a report...).
+
+    Args:
+        name (str): Name of the operation in the report.
+        func (callable): Operation, called without arguments.
+        ops (int): Number of items the call handles, used for the throughput.
+
+    Returns:
+        dict: Operation count, total seconds and throughput.
+    """
+    with quiet():
+        start = time.perf_counter()
+        func()
+        total = time.perf_counter() - start
+    return {
+        "name": name,
+        "ops": ops,
+        "seconds": round(total, 6),
+        "throughput": round(ops / total, 1) if total else None,
+    }
+
+
+def skipped(name, reason):
+    """Report entry for a benchmark that could not run here."""
+    return {"name": name, "skipped": reason}
+
+
+@contextlib.contextmanager
+def quiet():
+    """Drop what the tools print while they are measured."""
+    with contextlib.redirect_stdout(io.StringIO()) as buffer:
+        yield
+        # keep the buffer small on long runs
+        buffer.seek(0)
+        buffer.truncate()
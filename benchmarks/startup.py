@@ -0,0 +1,103 @@
+"""
+Cold-start regression check for the command line tools.
+
+Every case runs a CLI once per repeat under ``python -X importtime`` in a
+temporary directory and adds up the time spent importing modules, minus the
+imports the interpreter does anyway (``python -X importtime -c pass``). The
+median of the repeats has to stay under the budget of the case.
+
+Usage:
+    python benchmarks/startup.py [--repeat N] [--scale FACTOR]
+
+Exits with status 1 when a case is over its budget.
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WEATHER_DIR = os.path.join(ROOT, "Session13 & Session14", "Session14_Weather_Forecast")
+PYCOMMANDER = os.path.join(ROOT, "Final_Projects", "Python_Basic", "Final_Project.py")
+
+# name, script, arguments, files copied into the working directory, budget in ms
+CASES = [
+    ("pycommander pwd", PYCOMMANDER, ["pwd"], [], 10),
+    ("pycommander ls", PYCOMMANDER, ["ls"], [], 10),
+    ("weather --city", os.path.join(WEATHER_DIR, "project.py"), ["--city", "Chicago"],
+     [os.path.join(WEATHER_DIR, "weather_data.json")], 50),
+    ("weather --show-logs", os.path.join(WEATHER_DIR, "project.py"), ["--show-logs", "--tail", "1"],
+     [], 15),
+]
+
+
+def import_time(arguments, cwd):
+    """
+    Run Python with -X importtime and return the total import time.
+
+    Args:
+        arguments (list): Arguments passed to the interpreter after -X importtime.
+        cwd (str): Working directory of the run.
+
+    Returns:
+        float: Sum of the "self" import times of every module, in milliseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime"] + arguments,
+        cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time = line[len("import time:"):].split("|")[0].strip()
+        if self_time.isdigit():
+            total += int(self_time)
+    return total / 1000
+
+
+def run_case(script, arguments, files, repeat, baseline):
+    """
+    Measure the median import time of one command, without the baseline.
+
+    Args:
+        script (str): Path of the CLI script.
+        arguments (list): Command line of the CLI.
+        files (list): Files the command needs in its working directory.
+        repeat (int): Number of runs.
+        baseline (float): Import time of an empty interpreter run, in milliseconds.
+
+    Returns:
+        float: Median import time in milliseconds.
+    """
+    with tempfile.TemporaryDirectory() as cwd:
+        for name in files:
+            shutil.copy(name, cwd)
+        # the first run builds caches (bytecode, weather_data.db), it is not measured
+        import_time([script] + arguments, cwd)
+        times = [import_time([script] + arguments, cwd) for _ in range(repeat)]
+    return max(statistics.median(times) - baseline, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cold-start import time check")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, for slow machines")
+    args = parser.parse_args()
+
+    baseline = statistics.median(import_time(["-c", "pass"], ROOT) for _ in range(args.repeat))
+    failed = False
+    for name, script, arguments, files, budget in CASES:
+        took = run_case(script, arguments, files, args.repeat, baseline)
+        limit = budget * args.scale
+        status = "ok" if took <= limit else "OVER BUDGET"
+        failed = failed or took > limit
+        print(f"{name:<22} {took:8.2f} ms  (budget {limit:.0f} ms)  {status}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Synthetic data for the benchmarks, the same for the same seed."""
+import datetime
+import json
+import os
+import random
+
+CONDITIONS = ["Sunny", "Partly Cloudy", "Cloudy", "Rainy", "Windy", "Snowy", "Thunderstorms"]
+WORDS = ["laptop", "phone", "mouse", "keyboard", "monitor", "cable", "charger",
+         "speaker", "camera", "tablet", "desk", "lamp", "chair", "router", "printer"]
+
+# size ==> number of products, bookings, cities, and (depth, width) of the directory tree
+SIZES = {
+    "small": {"products": 20000, "bookings": 100000, "cities": 5000, "tree": (3, 8)},
+    "large": {"products": 1000000, "bookings": 1000000, "cities": 100000, "tree": (4, 10)},
+}
+
+
+def product_names(count, seed=0):
+    """
+    Generate unique product names made of two words and a number.
+
+    Args:
+        count (int): Number of names.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        list: The product names.
+    """
+    rng = random.Random(seed)
+    return [f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}" for i in range(count)]
+
+
+def misspell(name, rng):
+    """Swap two neighbouring letters of a name, like a typing mistake."""
+    if len(name) < 3:
+        return name
+    i = rng.randrange(len(name) - 1)
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+def write_product_batch(path, names, seed=0):
+    """
+    Write a batch file that adds, buys, edits and removes products.
+
+    Args:
+        path (str): File to write.
+        names (list): Products to add.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        int: Number of operations written.
+    """
+    rng = random.Random(seed)
+    ops = 0
+    with open(path, "w") as file:
+        for name in names:
+            file.write(f"add,{name}\n")
+        ops += len(names)
+        for name in names[::2]:
+            file.write(f"buy,{name},{rng.randrange(1, 1000)}\n")
+        ops += len(names[::2])
+        for name in names[:1000:2]:
+            file.write(f"edit,{name},{name} v2,{rng.randrange(1, 1000)}\n")
+        ops += len(names[:1000:2])
+        for name in names[1::10]:
+            file.write(f"remove,{name}\n")
+        ops += len(names[1::10])
+    return ops
+
+
+def write_bookings(path, count, cars=1000, seed=0):
+    """
+    Write a CSV file of bookings over one year.
+
+    Args:
+        path (str): File to write.
+        count (int): Number of bookings.
+        cars (int): Number of different cars.
+        seed (int): Seed of the random generator.
+    """
+    rng = random.Random(seed)
+    first_day = datetime.date(2023, 1, 1)
+    with open(path, "w") as file:
+        file.write("name,start_date,end_date,car,price\n")
+        for i in range(count):
+            start = first_day + datetime.timedelta(days=rng.randrange(365))
+            end = start + datetime.timedelta(days=rng.randrange(1, 15))
+            file.write(f"customer {i},{start},{end},car {rng.randrange(cars)},{rng.randrange(50, 500)}\n")
+
+
+def city_record(rng):
+    """One city in the format of weather_data.json."""
+    forecast = []
+    for i in range(5):
+        high = rng.randrange(-10, 40)
+        forecast.append({
+            "date": f"2023-11-{7 + i:02d}",
+            "condition": rng.choice(CONDITIONS),
+            "high": high,
+            "low": high - rng.randrange(1, 12),
+        })
+    return {
+        "current_condition": rng.choice(CONDITIONS),
+        "condition_percent": rng.randrange(101),
+        "forecast": forecast,
+    }
+
+
+def write_weather(path, count, seed=0):
+    """
+    Write a weather_data.json file with many cities, one city at a time.
+
+    Args:
+        path (str): File to write.
+        count (int): Number of cities.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        list: The city names.
+    """
+    rng = random.Random(seed)
+    cities = [f"City {i}" for i in range(count)]
+    with open(path, "w") as file:
+        file.write("{\n")
+        for i, city in enumerate(cities):
+            separator = ",\n" if i else ""
+            file.write(f"{separator}{json.dumps(city)}: {json.dumps(city_record(rng))}")
+        file.write("\n}\n")
+    return cities
+
+
+def make_tree(root, depth, width, files=3):
+    """
+    Create a directory tree with `width` sub-directories per level.
+
+    Args:
+        root (str): Directory to fill.
+        depth (int): Number of levels.
+        width (int): Sub-directories in every directory.
+        files (int): Files in every directory.
+
+    Returns:
+        list: Every directory of the tree, root first.
+    """
+    directories = [root]
+    level = [root]
+    for _ in range(depth):
+        next_level = []
+        for directory in level:
+            for i in range(width):
+                path = os.path.join(directory, f"dir{i}")
+                os.makedirs(path, exist_ok=True)
+                next_level.append(path)
+        directories.extend(next_level)
+        level = next_level
+    for directory in directories:
+        for i in range(files):
+            with open(os.path.join(directory, f"file{i}.txt"), "w") as file:
+                file.write("data\n")
+    return directories